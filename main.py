@@ -57,20 +57,41 @@ def configure_logging(level: str) -> None:
 
 def build_secrets_provider(config: AppConfig) -> SecretsProvider:
     provider = config.secrets_provider.lower()
+    cache_ttl_seconds = os.getenv("SECRETS_CACHE_TTL_SECONDS")
     if provider == "aws":
-        return get_secrets_provider("aws", region_name=os.getenv("AWS_REGION"))
+        return get_secrets_provider(
+            "aws",
+            region_name=os.getenv("AWS_REGION"),
+            cache_ttl_seconds=cache_ttl_seconds,
+        )
     if provider == "vault":
         return get_secrets_provider(
             "vault",
             url=os.getenv("VAULT_ADDR"),
             token=os.getenv("VAULT_TOKEN"),
             mount_point=os.getenv("VAULT_MOUNT", "secret"),
+            cache_ttl_seconds=cache_ttl_seconds,
         )
     if provider == "azure":
-        return get_secrets_provider("azure", vault_url=os.getenv("AZURE_KEY_VAULT_URL"))
+        return get_secrets_provider(
+            "azure",
+            vault_url=os.getenv("AZURE_KEY_VAULT_URL"),
+            cache_ttl_seconds=cache_ttl_seconds,
+        )
     raise ValueError(f"Unsupported secrets provider: {provider}")
 
 
+def prefetch_secrets(config: AppConfig, secrets: SecretsProvider, delivery_mode: str) -> None:
+    """Fetch every secret the run needs in one batch so later lookups hit the cache."""
+
+    secret_ids = [config.secret_refs.new_relic_api_key]
+    if delivery_mode in {"slack", "both"} and config.secret_refs.slack_webhook:
+        secret_ids.append(config.secret_refs.slack_webhook)
+    if delivery_mode in {"email", "both"} and config.secret_refs.o365_credentials:
+        secret_ids.append(config.secret_refs.o365_credentials)
+    secrets.get_secrets(secret_ids)
+
+
 def build_deliveries(config: AppConfig, secrets: SecretsProvider, delivery_mode: str) -> Dict[str, object]:
     deliveries: Dict[str, object] = {}
     if delivery_mode in {"slack", "both"}:
@@ -114,7 +135,15 @@ def _build_email_delivery(config: AppConfig, secrets: SecretsProvider) -> Option
     if not recipients:
         logging.warning("EMAIL_RECIPIENTS not configured; skipping email delivery")
         return None
-    client = O365EmailDelivery(tenant_id, client_id, client_secret, sender_email)
+    token_cache_path = os.getenv("O365_TOKEN_CACHE_PATH")
+    client = O365EmailDelivery(
+        tenant_id,
+        client_id,
+        client_secret,
+        sender_email,
+        token_cache_path=Path(token_cache_path) if token_cache_path else None,
+        recipients=recipients,
+    )
     return {"client": client, "recipients": recipients}
 
 
@@ -130,6 +159,7 @@ def main() -> None:
     env_path = Path(args.env_file) if args.env_file else None
     config = load_config(env_path)
     secrets_provider = build_secrets_provider(config)
+    prefetch_secrets(config, secrets_provider, args.delivery)
 
     pipeline = TPSReportPipeline(
         config=config,
@@ -3,80 +3,170 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Widget fields consumed by WidgetParser; layout and visualization ids are unused.
+DEFAULT_WIDGET_FIELDS: Tuple[str, ...] = (
+    "id",
+    "title",
+    "rawConfiguration",
+    "data { raw visualization }",
+)
+
+_ERRORS_PREFIX = "errors"
+
+
+def _alias(index: int) -> str:
+    return f"d{index}"
+
+
+def _widget_prefix(alias: str) -> str:
+    return f"data.actor.{alias}.pages.item.widgets.item"
+
+
+@lru_cache(maxsize=32)
+def _widgets_query(count: int, fields: Tuple[str, ...] = DEFAULT_WIDGET_FIELDS) -> str:
+    """Return the widgets query for *count* dashboards.
+
+    GUIDs are passed as GraphQL variables ($d0, $d1, ...) rather than
+    interpolated, so the query text only depends on the dashboard count and
+    field selection and stays byte-identical across runs. Each dashboard is
+    aliased to its variable name to keep the response unambiguous.
+    """
+
+    if count < 1:
+        raise ValueError(f"Widgets query needs at least one dashboard, got {count}")
+    selection = "\n            ".join(fields)
+    variables = ", ".join(f"${_alias(index)}: EntityGuid!" for index in range(count))
+    entities = "".join(
+        f"""
+    {_alias(index)}: entity(guid: ${_alias(index)}) {{
+      ... on DashboardEntity {{
+        pages {{
+          widgets {{
+            {selection}
+          }}
+        }}
+      }}
+    }}"""
+        for index in range(count)
+    )
+    return f"query({variables}) {{\n  actor {{{entities}\n  }}\n}}"
+
 
 class NewRelicDashboardClient:
     """Thin wrapper around the NerdGraph API for dashboard widgets."""
 
     GRAPHQL_URL = "https://api.newrelic.com/graphql"
 
-    def __init__(self, api_key: str, dashboard_guid: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        dashboard_guid: str,
+        fields: Sequence[str] = DEFAULT_WIDGET_FIELDS,
+    ) -> None:
         self._dashboard_guid = dashboard_guid
+        self._fields = tuple(fields)
         self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=retry),
+        )
         self._session.headers.update(
             {
                 "API-Key": api_key,
                 "Content-Type": "application/json",
+                "Accept-Encoding": "gzip",
             }
         )
 
-    def fetch_widgets(self) -> List[Dict[str, Any]]:
-        """Return all widgets for the configured dashboard."""
+    def fetch_widgets(self) -> Iterator[Dict[str, Any]]:
+        """Stream the widgets for the configured dashboard one at a time.
+
+        The response body is parsed incrementally, so neither the raw bytes
+        nor the full decoded document are held in memory at once. GraphQL
+        errors are raised once the stream has been consumed.
+        """
 
         logger.info("Fetching dashboard widgets for %s", self._dashboard_guid)
-        payload = {"query": self._widgets_query(self._dashboard_guid)}
-        response = self._session.post(self.GRAPHQL_URL, json=payload, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-
-        errors = data.get("errors")
-        if errors:
-            logger.error("NerdGraph returned errors: %s", errors)
-            raise RuntimeError(f"Dashboard query failed: {errors}")
-
-        pages = (
-            data.get("data", {})
-            .get("actor", {})
-            .get("entity", {})
-            .get("pages", [])
-        )
+        return (widget for _, widget in self._stream_widgets([self._dashboard_guid]))
+
+    def fetch_dashboards(self, guids: Sequence[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Return widgets for several dashboards using a single NerdGraph request."""
 
-        widgets: List[Dict[str, Any]] = []
-        for page in pages:
-            widgets.extend(page.get("widgets", []))
-        logger.debug("Fetched %d widgets", len(widgets))
+        widgets: Dict[str, List[Dict[str, Any]]] = {guid: [] for guid in guids}
+        if not widgets:
+            return widgets
+        logger.info("Fetching dashboard widgets for %d dashboards", len(widgets))
+        for guid, widget in self._stream_widgets(list(widgets)):
+            widgets[guid].append(widget)
         return widgets
 
-    @staticmethod
-    def _widgets_query(guid: str) -> str:
-        return f"""
-        {{
-          actor {{
-            entity(guid: \"{guid}\") {{
-              ... on DashboardEntity {{
-                pages {{
-                  widgets {{
-                    id
-                    title
-                    visualization {{ id }}
-                    rawConfiguration
-                    layout {{ column row width height }}
-                    data {{
-                      raw
-                      visualization
-                    }}
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-        """
+    def _stream_widgets(self, guids: Sequence[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        payload = {
+            "query": _widgets_query(len(guids), self._fields),
+            "variables": {_alias(index): guid for index, guid in enumerate(guids)},
+        }
+        response = self._session.post(self.GRAPHQL_URL, data=orjson.dumps(payload), timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        response.raw.decode_content = True
+        prefixes = {_widget_prefix(_alias(index)): guid for index, guid in enumerate(guids)}
+        return self._iter_widgets(response, prefixes)
+
+    def _iter_widgets(
+        self,
+        response: requests.Response,
+        prefixes: Dict[str, str],
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        widget: Optional[ijson.ObjectBuilder] = None
+        widget_prefix = ""
+        errors: Optional[ijson.ObjectBuilder] = None
+        count = 0
+        try:
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if widget is not None:
+                    widget.event(event, value)
+                    if prefix == widget_prefix and event == "end_map":
+                        count += 1
+                        yield prefixes[widget_prefix], widget.value
+                        widget = None
+                elif errors is not None:
+                    errors.event(event, value)
+                    if prefix == _ERRORS_PREFIX and event == "end_array":
+                        break
+                elif event == "start_map" and prefix in prefixes:
+                    widget = ijson.ObjectBuilder()
+                    widget.event(event, value)
+                    widget_prefix = prefix
+                elif prefix == _ERRORS_PREFIX and event == "start_array":
+                    errors = ijson.ObjectBuilder()
+                    errors.event(event, value)
+        finally:
+            response.close()
+
+        if errors is not None and errors.value:
+            logger.error("NerdGraph returned errors: %s", errors.value)
+            raise RuntimeError(f"Dashboard query failed: {errors.value}")
+        logger.debug("Fetched %d widgets", count)
 
 
 __all__ = ["NewRelicDashboardClient"]
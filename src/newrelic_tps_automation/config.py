@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -96,12 +97,7 @@ def _require_env(key: str) -> str:
 
 
 def _get_env(key: str, default: Optional[str] = None) -> Optional[str]:
-    import os
-
-    value = os.getenv(key)
-    if value is None:
-        return default
-    return value
+    return os.environ.get(key, default)
 
 
 __all__ = [
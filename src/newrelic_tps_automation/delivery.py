@@ -3,25 +3,63 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Optional
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import orjson
 import requests
-from msal import ConfidentialClientApplication
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+TOKEN_EXPIRY_SKEW_SECONDS = 60
+MAX_RECIPIENTS_PER_MESSAGE = 50
+MAX_CONCURRENT_SENDS = 4
+
+
+def _build_session() -> requests.Session:
+    """Return a keep-alive session that retries POSTs the server never processed.
+
+    Slack posts and Graph sends are not idempotent, so only connection failures
+    and 429 throttling are retried; a read timeout or gateway error may follow a
+    delivered message and would duplicate it.
+    """
+
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[429],
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    # Payloads are pre-serialized with orjson and sent as raw bytes.
+    session.headers["Content-Type"] = "application/json"
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class SlackDelivery:
     """Send messages via Slack incoming webhooks."""
 
     def __init__(self, webhook_url: str):
         self._webhook_url = webhook_url
+        self._session = _build_session()
 
     def send(self, message: str) -> bool:
         try:
-            response = requests.post(
+            response = self._session.post(
                 self._webhook_url,
-                json={"text": message, "mrkdwn": True},
+                data=orjson.dumps({"text": message, "mrkdwn": True}),
                 timeout=10,
             )
             response.raise_for_status()
@@ -35,47 +73,130 @@ class SlackDelivery:
 class O365EmailDelivery:
     """Send HTML emails via Microsoft Graph using OAuth 2.0."""
 
-    def __init__(self, tenant_id: str, client_id: str, client_secret: str, sender_email: str):
+    def __init__(
+        self,
+        tenant_id: str,
+        client_id: str,
+        client_secret: str,
+        sender_email: str,
+        token_cache_path: Optional[Path] = None,
+        recipients: Optional[Sequence[str]] = None,
+    ):
+        # msal is only needed for email delivery; import it on first use.
+        from msal import ConfidentialClientApplication, SerializableTokenCache
+
         self._sender_email = sender_email
+        self._token_cache_path = token_cache_path
+        self._token_cache = SerializableTokenCache()
+        if token_cache_path and token_cache_path.exists():
+            self._load_token_cache()
         authority = f"https://login.microsoftonline.com/{tenant_id}"
         self._app = ConfidentialClientApplication(
             client_id=client_id,
             authority=authority,
             client_credential=client_secret,
+            token_cache=self._token_cache,
+            timeout=10,
         )
         self._scope = ["https://graph.microsoft.com/.default"]
+        self._session = _build_session()
+        self._session_token: Optional[str] = None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._recipient_batches: Tuple[Tuple[str, ...], List[List[Dict[str, Any]]]] = ((), [[]])
+        if recipients:
+            self._batches_for(recipients)
 
     def _get_token(self) -> str:
+        if self._token and time.time() < self._token_expires_at - TOKEN_EXPIRY_SKEW_SECONDS:
+            return self._token
         result = self._app.acquire_token_silent(self._scope, account=None)
         if not result:
             result = self._app.acquire_token_for_client(scopes=self._scope)
         if "access_token" not in result:
             raise RuntimeError(f"Failed to acquire access token: {result}")
-        return result["access_token"]
+        self._token = result["access_token"]
+        self._token_expires_at = time.time() + float(result.get("expires_in", 0))
+        self._persist_token_cache()
+        return self._token
+
+    def _load_token_cache(self) -> None:
+        try:
+            self._token_cache.deserialize(self._token_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable MSAL token cache %s: %s", self._token_cache_path, exc)
+
+    def _persist_token_cache(self) -> None:
+        if not self._token_cache_path or not self._token_cache.has_state_changed:
+            return
+        # Write a private temp file and swap it in, so concurrent runs never
+        # read a partially written cache.
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._token_cache_path.parent, prefix=f".{self._token_cache_path.name}."
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self._token_cache.serialize())
+            os.replace(tmp_path, self._token_cache_path)
+        except OSError as exc:
+            logger.warning("Failed to persist MSAL token cache to %s: %s", self._token_cache_path, exc)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def send(self, subject: str, body: str, recipients: Iterable[str]) -> bool:
         token = self._get_token()
+        if token != self._session_token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+            self._session_token = token
+        batches = self._batches_for(recipients)
+        if len(batches) == 1:
+            return self._send_message(subject, body, batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_SENDS)) as executor:
+            results = list(executor.map(lambda batch: self._send_message(subject, body, batch), batches))
+        failed = results.count(False)
+        if failed:
+            logger.error("Failed to send %d of %d email batches", failed, len(batches))
+        return not failed
+
+    def _batches_for(self, recipients: Iterable[str]) -> List[List[Dict[str, Any]]]:
+        """Return Graph toRecipients batches, reusing them while recipients are unchanged.
+
+        Recipients are expected to be stripped and non-empty already.
+        """
+
+        addresses = tuple(recipients)
+        cached_addresses, batches = self._recipient_batches
+        if addresses != cached_addresses:
+            to_recipients = [{"emailAddress": {"address": address}} for address in addresses]
+            batches = [
+                to_recipients[start : start + MAX_RECIPIENTS_PER_MESSAGE]
+                for start in range(0, len(to_recipients), MAX_RECIPIENTS_PER_MESSAGE)
+            ] or [[]]
+            self._recipient_batches = (addresses, batches)
+        return batches
+
+    def _send_message(self, subject: str, body: str, to_recipients: List[Dict[str, Any]]) -> bool:
         payload = {
             "message": {
                 "subject": subject,
                 "body": {"contentType": "HTML", "content": body},
-                "toRecipients": [
-                    {"emailAddress": {"address": recipient.strip()}}
-                    for recipient in recipients
-                    if recipient.strip()
-                ],
+                "toRecipients": to_recipients,
             },
             "saveToSentItems": "true",
         }
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"https://graph.microsoft.com/v1.0/users/{self._sender_email}/sendMail",
-                headers={"Authorization": f"Bearer {token}"},
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10,
             )
             response.raise_for_status()
-            logger.info("Report email sent via Microsoft Graph")
+            logger.info("Report email sent via Microsoft Graph to %d recipients", len(to_recipients))
             return True
         except requests.RequestException as exc:  # pragma: no cover - network
             logger.error("Failed to send email: %s", exc)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, Optional
 
@@ -17,6 +18,9 @@ from .secrets import SecretsProvider, extract_secret_field
 
 logger = logging.getLogger(__name__)
 
+TEXT_TEMPLATE = "tps_report.j2"
+HTML_TEMPLATE = "tps_report_html.j2"
+
 
 class TPSReportPipeline:
     """Coordinates data retrieval, translation, rendering, and delivery."""
@@ -32,27 +36,37 @@ class TPSReportPipeline:
         self._renderer = TemplateRenderer(templates_dir)
         self._context_builder = ReportContextBuilder(config.report)
         self._translator = TrendTranslator(config.thresholds)
+        self._parser = WidgetParser()
 
     def run(
         self,
         deliveries: Dict[str, object],
         event_name: Optional[str] = None,
     ) -> str:
-        """Execute the report generation pipeline. Returns rendered report."""
+        """Execute the report generation pipeline. Returns rendered report.
+
+        When email is the only channel the HTML variant is returned.
+        """
 
         api_key = self._get_new_relic_api_key()
         client = NewRelicDashboardClient(api_key=api_key, dashboard_guid=self._config.dashboard_guid)
-        dashboard_service = DashboardService(client, parser=WidgetParser())
+        dashboard_service = DashboardService(client, parser=self._parser)
         metrics = dashboard_service.get_metrics()
         if not metrics:
             raise RuntimeError("No metrics could be parsed from the dashboard response")
 
         analysis = self._translator.translate(metrics)
         context = self._context_builder.build(metrics, analysis, event_name=event_name)
-        report = self._renderer.render("tps_report.j2", context.as_dict())
+        context_dict = context.as_dict()
 
-        self._deliver(report, deliveries, context)
-        return report
+        # Render only the variants the active channels need: Markdown for
+        # Slack/console and HTML for email.
+        needs_text = not deliveries or any(name != "email" for name in deliveries)
+        report = self._renderer.render(TEXT_TEMPLATE, context_dict) if needs_text else None
+        html_report = self._renderer.render(HTML_TEMPLATE, context_dict) if "email" in deliveries else None
+
+        self._deliver(report, html_report, deliveries, context)
+        return report if report is not None else html_report
 
     def _get_new_relic_api_key(self) -> str:
         secret_id = self._config.secret_refs.new_relic_api_key
@@ -62,24 +76,50 @@ class TPSReportPipeline:
             raise RuntimeError(f"Secret {secret_id} did not contain a New Relic API key")
         return api_key
 
-    def _deliver(self, report: str, deliveries: Dict[str, object], context) -> None:
+    def _deliver(
+        self,
+        report: Optional[str],
+        html_report: Optional[str],
+        deliveries: Dict[str, object],
+        context,
+    ) -> None:
         if not deliveries:
             logger.info("No delivery channels configured; printing to stdout")
             print(report)
             return
 
-        for name, delivery in deliveries.items():
-            if name == "slack":
-                delivery.send(report)
-            elif name == "email":
-                recipients = delivery.get("recipients")  # type: ignore[assignment]
-                client = delivery.get("client")
-                if client and recipients:
-                    subject = f"TPS Report: {context.event_name}"
-                    html_body = report.replace("\n", "<br>")
-                    client.send(subject, html_body, recipients)
-            else:
-                logger.warning("Unsupported delivery channel: %s", name)
+        # Channels are independent network calls, so send them concurrently.
+        # Every channel's requests have their own HTTP timeout, so joining them is bounded.
+        with ThreadPoolExecutor(max_workers=len(deliveries)) as executor:
+            futures = {
+                executor.submit(self._send, name, delivery, report, html_report, context): name
+                for name, delivery in deliveries.items()
+            }
+
+        errors = [(name, future.exception()) for future, name in futures.items() if future.exception()]
+        for name, exc in errors:
+            logger.error("Delivery via %s failed: %s", name, exc)
+        if errors:
+            raise errors[0][1]
+
+    def _send(
+        self,
+        name: str,
+        delivery: object,
+        report: Optional[str],
+        html_report: Optional[str],
+        context,
+    ) -> None:
+        if name == "slack":
+            delivery.send(report)
+        elif name == "email":
+            recipients = delivery.get("recipients")  # type: ignore[assignment]
+            client = delivery.get("client")
+            if client and recipients:
+                subject = f"TPS Report: {context.event_name}"
+                client.send(subject, html_report, recipients)
+        else:
+            logger.warning("Unsupported delivery channel: %s", name)
 
 
 __all__ = ["TPSReportPipeline"]
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from ..config import ReportConfig
 from ..services.trend_translator import AnalysisResult
@@ -36,7 +35,11 @@ class ReportContext:
     hpns_avg_capacity: str
 
     def as_dict(self) -> Dict[str, str]:  # pragma: no cover - convenience
-        return asdict(self)
+        # Every field is a flat string, so a shallow copy avoids asdict's deepcopy.
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(ReportContext))
 
 
 class ReportContextBuilder:
@@ -44,13 +47,13 @@ class ReportContextBuilder:
 
     def __init__(self, config: ReportConfig):
         self._config = config
+        self._tz = ZoneInfo(config.timezone)
 
     def build(self, metrics: Dict[str, Dict[str, float]], analysis: AnalysisResult, event_name: str | None = None) -> ReportContext:
-        tz = pytz.timezone(self._config.timezone)
-        now = datetime.now(tz)
-        report_date = now.strftime("%B %d, %Y")
+        now = datetime.now(self._tz)
+        report_date = f"{now:%B %d, %Y}"
         report_time = now.strftime("%-I:%M %p %Z")
-        timestamp = now.strftime("%b %d at %-I:%M %p %Z")
+        timestamp = f"{now:%b %d} at {report_time}"
 
         tsys = metrics.get("tsys_tps", {})
         hpns = metrics.get("hpns_tps", {})
@@ -2,21 +2,50 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Dict, Mapping, Optional
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
+logger = logging.getLogger(__name__)
 
-class TemplateRenderer:
-    """Simple Jinja2 renderer that loads templates from disk."""
 
-    def __init__(self, templates_dir: Path):
-        self._env = Environment(loader=FileSystemLoader(str(templates_dir)))
+class TemplateRenderer:
+    """Simple Jinja2 renderer that loads templates from disk.
+
+    Compiled templates are memoized per renderer and their bytecode is cached
+    on disk, so repeated renders skip both the file stat and the compile step.
+    """
+
+    def __init__(self, templates_dir: Path, bytecode_cache_dir: Optional[Path] = None):
+        self._env = Environment(
+            loader=FileSystemLoader(str(templates_dir), encoding="utf-8", followlinks=False),
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=_build_bytecode_cache(bytecode_cache_dir),
+            enable_async=False,
+        )
+        self._templates: Dict[str, Template] = {}
 
     def render(self, template_name: str, context: Mapping[str, Any]) -> str:
-        template: Template = self._env.get_template(template_name)
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._env.get_template(template_name)
+            self._templates[template_name] = template
         return template.render(**context)
 
 
+def _build_bytecode_cache(directory: Optional[Path]) -> Optional[FileSystemBytecodeCache]:
+    # Bytecode is executed on load, so only use a directory the caller owns or
+    # the per-user 0700 directory Jinja creates and validates itself.
+    if directory is not None:
+        return FileSystemBytecodeCache(str(directory))
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as exc:
+        logger.warning("Jinja bytecode cache disabled: %s", exc)
+        return None
+
+
 __all__ = ["TemplateRenderer"]
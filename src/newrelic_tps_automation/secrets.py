@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from functools import lru_cache
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
-import boto3
-import hvac
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
+import orjson
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from azure.identity import DefaultAzureCredential
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SECRET_TTL_SECONDS = 300.0
+MAX_CONCURRENT_SECRET_FETCHES = 8
+AWS_BATCH_GET_LIMIT = 20
+
+_PROVIDERS: Dict[Tuple[Any, ...], SecretsProvider] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
 
 class SecretsProvider(ABC):
     """Abstract secrets provider interface."""
@@ -23,11 +31,23 @@ class SecretsProvider(ABC):
     def get_secret(self, secret_id: str) -> Any:  # pragma: no cover - interface
         """Return the secret payload identified by *secret_id*."""
 
+    def get_secrets(self, secret_ids: Iterable[str]) -> Dict[str, Any]:
+        """Return a mapping of *secret_ids* to their payloads.
+
+        Providers override this when the backend supports batched or
+        concurrent reads; the default fetches each secret in turn.
+        """
+
+        return {secret_id: self.get_secret(secret_id) for secret_id in _unique(secret_ids)}
+
 
 class AWSSecretsProvider(SecretsProvider):
     """AWS Secrets Manager implementation."""
 
     def __init__(self, region_name: Optional[str] = None):
+        # SDKs are imported lazily so a run only pays for the provider it uses.
+        import boto3
+
         self._client = boto3.client("secretsmanager", region_name=region_name)
 
     def get_secret(self, secret_id: str) -> Any:
@@ -36,11 +56,44 @@ class AWSSecretsProvider(SecretsProvider):
         secret = response.get("SecretString") or response.get("SecretBinary")
         return _maybe_parse_json(secret)
 
+    def get_secrets(self, secret_ids: Iterable[str]) -> Dict[str, Any]:
+        from botocore.exceptions import ClientError
+
+        ids = _unique(secret_ids)
+        results: Dict[str, Any] = {}
+        for start in range(0, len(ids), AWS_BATCH_GET_LIMIT):
+            chunk = ids[start : start + AWS_BATCH_GET_LIMIT]
+            logger.debug("Batch fetching %d secrets from AWS Secrets Manager", len(chunk))
+            try:
+                response = self._client.batch_get_secret_value(SecretIdList=chunk)
+            except (ClientError, AttributeError) as exc:
+                # Denied by IAM, or a botocore release without the operation.
+                logger.info("Batch secret fetch unavailable, fetching individually: %s", exc)
+                break
+            for entry in response.get("SecretValues", []):
+                secret_id = entry.get("Name") if entry.get("Name") in chunk else entry.get("ARN")
+                if secret_id in chunk:
+                    secret = entry.get("SecretString") or entry.get("SecretBinary")
+                    results[secret_id] = _maybe_parse_json(secret)
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "AWS Secrets Manager could not return %s: %s",
+                    error.get("SecretId"),
+                    error.get("Message"),
+                )
+        # Surface the provider's usual error for anything the batch call dropped.
+        for secret_id in ids:
+            if secret_id not in results:
+                results[secret_id] = self.get_secret(secret_id)
+        return results
+
 
 class VaultSecretsProvider(SecretsProvider):
     """HashiCorp Vault implementation."""
 
     def __init__(self, url: str, token: str, mount_point: str = "secret"):
+        import hvac
+
         self._client = hvac.Client(url=url, token=token)
         self._mount_point = mount_point
 
@@ -52,11 +105,17 @@ class VaultSecretsProvider(SecretsProvider):
         data = response.get("data", {}).get("data", {})
         return data
 
+    def get_secrets(self, secret_ids: Iterable[str]) -> Dict[str, Any]:
+        return _fetch_concurrently(self, secret_ids)
+
 
 class AzureKeyVaultProvider(SecretsProvider):
     """Azure Key Vault implementation."""
 
     def __init__(self, vault_url: str, credential: Optional[DefaultAzureCredential] = None):
+        from azure.identity import DefaultAzureCredential
+        from azure.keyvault.secrets import SecretClient
+
         self._credential = credential or DefaultAzureCredential()
         self._client = SecretClient(vault_url=vault_url, credential=self._credential)
 
@@ -65,17 +124,88 @@ class AzureKeyVaultProvider(SecretsProvider):
         secret = self._client.get_secret(secret_id)
         return _maybe_parse_json(secret.value)
 
+    def get_secrets(self, secret_ids: Iterable[str]) -> Dict[str, Any]:
+        return _fetch_concurrently(self, secret_ids)
+
+
+class CachingSecretsProvider(SecretsProvider):
+    """Decorator that caches another provider's secrets in memory with a TTL."""
+
+    def __init__(self, provider: SecretsProvider, ttl_seconds: float = DEFAULT_SECRET_TTL_SECONDS):
+        self._provider = provider
+        self._ttl_seconds = ttl_seconds
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_secret(self, secret_id: str) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(secret_id)
+        if cached is not None and now < cached[1]:
+            logger.debug("Using cached secret %s", secret_id)
+            return cached[0]
+
+        value = self._provider.get_secret(secret_id)
+        with self._lock:
+            self._cache[secret_id] = (value, time.monotonic() + self._ttl_seconds)
+        return value
+
+    def get_secrets(self, secret_ids: Iterable[str]) -> Dict[str, Any]:
+        ids = _unique(secret_ids)
+        now = time.monotonic()
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        with self._lock:
+            for secret_id in ids:
+                cached = self._cache.get(secret_id)
+                if cached is not None and now < cached[1]:
+                    results[secret_id] = cached[0]
+                else:
+                    missing.append(secret_id)
+
+        if missing:
+            fetched = self._provider.get_secrets(missing)
+            expires_at = time.monotonic() + self._ttl_seconds
+            with self._lock:
+                for secret_id, value in fetched.items():
+                    self._cache[secret_id] = (value, expires_at)
+            results.update(fetched)
+        return {secret_id: results[secret_id] for secret_id in ids}
+
+    def invalidate(self, secret_id: Optional[str] = None) -> None:
+        """Drop *secret_id* from the cache, or every cached secret when omitted."""
+
+        with self._lock:
+            if secret_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(secret_id, None)
+
+
+def _unique(secret_ids: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(secret_ids))
+
+
+def _fetch_concurrently(provider: SecretsProvider, secret_ids: Iterable[str]) -> Dict[str, Any]:
+    ids = _unique(secret_ids)
+    if len(ids) <= 1:
+        return {secret_id: provider.get_secret(secret_id) for secret_id in ids}
+    with ThreadPoolExecutor(max_workers=min(len(ids), MAX_CONCURRENT_SECRET_FETCHES)) as executor:
+        values = list(executor.map(provider.get_secret, ids))
+    return dict(zip(ids, values))
+
 
 def _maybe_parse_json(value: Any) -> Any:
     if isinstance(value, (dict, list)):
         return value
     if not value:
         return value
-    if isinstance(value, bytes):
-        value = value.decode("utf-8")
     try:
-        return json.loads(value)
-    except (TypeError, ValueError):
+        # orjson accepts bytes directly, skipping a separate decode pass.
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
         return value
 
 
@@ -88,15 +218,43 @@ def extract_secret_field(secret_payload: Any, *keys: str, default: Optional[str]
         return secret_payload
     if isinstance(secret_payload, dict):
         for key in keys:
-            if key in secret_payload:
-                return secret_payload[key]
+            value = secret_payload.get(key)
+            if value is not None:
+                return value
     return default
 
 
-@lru_cache(maxsize=1)
 def get_secrets_provider(name: str, **kwargs: Any) -> SecretsProvider:
-    """Factory returning the configured secrets provider."""
+    """Factory returning the configured secrets provider wrapped in a TTL cache.
+
+    Providers are memoized per (name, kwargs) so repeated calls reuse the
+    underlying SDK client; calls with unhashable kwargs are not cached.
+    """
+
+    try:
+        key: Optional[Tuple[Any, ...]] = (name.lower(), frozenset(kwargs.items()))
+        hash(key)
+    except TypeError:
+        key = None
+
+    if key is not None:
+        with _PROVIDERS_LOCK:
+            cached = _PROVIDERS.get(key)
+        if cached is not None:
+            return cached
+
+    ttl_seconds = kwargs.pop("cache_ttl_seconds", None)
+    if ttl_seconds is None:
+        ttl_seconds = DEFAULT_SECRET_TTL_SECONDS
+    provider = CachingSecretsProvider(_build_provider(name, **kwargs), ttl_seconds=float(ttl_seconds))
+
+    if key is not None:
+        with _PROVIDERS_LOCK:
+            provider = _PROVIDERS.setdefault(key, provider)
+    return provider
+
 
+def _build_provider(name: str, **kwargs: Any) -> SecretsProvider:
     normalized = name.lower()
     if normalized == "aws":
         return AWSSecretsProvider(region_name=kwargs.get("region_name"))
@@ -119,6 +277,7 @@ __all__ = [
     "AWSSecretsProvider",
     "VaultSecretsProvider",
     "AzureKeyVaultProvider",
+    "CachingSecretsProvider",
     "get_secrets_provider",
     "extract_secret_field",
 ]
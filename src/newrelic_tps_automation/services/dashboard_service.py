@@ -22,10 +22,11 @@ class DashboardService:
         """Fetch widgets and parse into the normalized KPI dictionary."""
 
         widgets = self._client.fetch_widgets()
-        if not widgets:
-            logger.warning("No widgets returned from dashboard GUID %s", self._client._dashboard_guid)
         metrics = self._parser.parse(widgets)
-        logger.debug("Normalized metrics: %s", metrics)
+        if not metrics:
+            logger.warning("No widget metrics returned from dashboard GUID %s", self._client._dashboard_guid)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Normalized metrics: %s", metrics)
         return metrics
 
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from ..config import MetricThresholds
 
@@ -22,6 +23,8 @@ class TrendTranslator:
 
     def __init__(self, thresholds: MetricThresholds):
         self._thresholds = thresholds
+        self._cap_crit = float(thresholds.capacity_critical)
+        self._cap_warn = float(thresholds.capacity_warning)
 
     def translate(self, metrics: Dict[str, Dict[str, float]]) -> AnalysisResult:
         trends: List[str] = []
@@ -51,7 +54,7 @@ class TrendTranslator:
 
     def _ratio_trend(self, ratio: Dict[str, float]) -> str:
         comparison = ratio.get("comparison_pct", 0.0)
-        direction = "lower" if comparison < 0 else "higher"
+        direction = ("higher", "lower")[comparison < 0]
         comparison_abs = abs(comparison)
         return (
             f"Requests that require data from HPNS have been approx. {ratio.get('current_value', 0):.1f}% of total, "
@@ -59,16 +62,15 @@ class TrendTranslator:
         )
 
     def _capacity_trend(self, tsys_capacity: Dict[str, float], hpns_capacity: Dict[str, float]) -> str:
-        tsys_val = tsys_capacity.get("current_value", 0.0)
-        hpns_val = hpns_capacity.get("current_value", 0.0)
+        tsys_val, hpns_val = _pair_vals(tsys_capacity, hpns_capacity)
         max_val = max(tsys_val, hpns_val)
-        if max_val >= self._thresholds.capacity_critical:
+        if max_val >= self._cap_crit:
             service = "TSYS" if tsys_val >= hpns_val else "HPNS"
             return (
                 f"⚠️ Capacity utilization is elevated at {max_val:.1f}% for {service}. "
                 "Recommend monitoring closely."
             )
-        if max_val >= self._thresholds.capacity_warning:
+        if max_val >= self._cap_warn:
             return (
                 "Capacity utilization is elevated but manageable "
                 f"(TSYS: {tsys_val:.1f}%, HPNS: {hpns_val:.1f}%). Monitoring trends."
@@ -78,15 +80,11 @@ class TrendTranslator:
     def _trend_phrase(self, service_name: str, metric: Dict[str, float]) -> str:
         comparison = abs(metric.get("comparison_pct", 0.0))
         trend = metric.get("trend", "neutral")
-        if trend == "up":
-            return f"The TPS is {comparison:.1f}% higher than last week for {service_name}"
-        if trend == "down":
-            return f"The TPS is {comparison:.1f}% lower than last week for {service_name}"
-        return f"The TPS is stable for {service_name}"
+        # Rounding to the displayed precision keeps the cache key stable across refreshes.
+        return _trend_phrase_text(service_name, round(comparison, 1), trend)
 
     def _traffic_status(self, tsys: Dict[str, float] | None, hpns: Dict[str, float] | None) -> str:
-        tsys_val = (tsys or {}).get("current_value", 0.0)
-        hpns_val = (hpns or {}).get("current_value", 0.0)
+        tsys_val, hpns_val = _pair_vals(tsys, hpns)
         if tsys_val > 2000 and hpns_val > 800:
             return "🟢"
         if tsys_val > 1000 or hpns_val > 400:
@@ -94,14 +92,34 @@ class TrendTranslator:
         return "🔴"
 
     def _capacity_status(self, tsys_capacity: Dict[str, float] | None, hpns_capacity: Dict[str, float] | None) -> str:
-        tsys_val = (tsys_capacity or {}).get("current_value", 0.0)
-        hpns_val = (hpns_capacity or {}).get("current_value", 0.0)
+        tsys_val, hpns_val = _pair_vals(tsys_capacity, hpns_capacity)
         max_val = max(tsys_val, hpns_val)
-        if max_val >= self._thresholds.capacity_critical:
+        if max_val >= self._cap_crit:
             return "🔴"
-        if max_val >= self._thresholds.capacity_warning:
+        if max_val >= self._cap_warn:
             return "🟡"
         return "🟢"
 
 
+_TREND_TEMPLATES = {
+    "up": "The TPS is {comparison:.1f}% higher than last week for {service}",
+    "down": "The TPS is {comparison:.1f}% lower than last week for {service}",
+    "neutral": "The TPS is stable for {service}",
+}
+
+
+@lru_cache(maxsize=128)
+def _trend_phrase_text(service_name: str, comparison: float, trend: str) -> str:
+    template = _TREND_TEMPLATES.get(trend, _TREND_TEMPLATES["neutral"])
+    return template.format(comparison=comparison, service=service_name)
+
+
+def _pair_vals(
+    first: Dict[str, float] | None,
+    second: Dict[str, float] | None,
+    key: str = "current_value",
+) -> Tuple[float, float]:
+    return (first or {}).get(key, 0.0), (second or {}).get(key, 0.0)
+
+
 __all__ = ["TrendTranslator", "AnalysisResult"]
@@ -2,33 +2,57 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
+import math
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
-import pytz
+_TZ_ET = ZoneInfo("US/Eastern")
+_TZ_UTC = timezone.utc
 
-
-@dataclass
-class WidgetMetric:
-    """Normalized representation of a dashboard widget."""
-
-    title: str
-    current_value: float
-    comparison_pct: float
-    trend: str
-    display_value: str
-    peak_value: Optional[float] = None
-    peak_time: Optional[str] = None
+_NUMERIC_RE = re.compile(r"-?\d+(?:\.\d+)?")
+# Whole-string "<number>[k|m][%]" match, covering the common display values in one pass.
+# The "%" must touch the suffix; the fallback below reads "5k %" as 5, not 5000.
+_SUFFIXED_NUMBER_RE = re.compile(r"(-?\d+(?:\.\d+)?)(?:\s*([kKmM]))?%?")
+_SUFFIX_MULTIPLIERS = {"": 1.0, "k": 1_000.0, "K": 1_000.0, "m": 1_000_000.0, "M": 1_000_000.0}
+# Character classes mirroring WidgetParser.TREND_ARROWS; up arrows take precedence.
+_UP_ARROW_RE = re.compile("[↗▲↑]")
+_DOWN_ARROW_RE = re.compile("[↘▼↓]")
+_WORD_RE = re.compile(r"[a-z]+")
+# Point key priorities, shared by the generic walk and the series fast path.
+_VALUE_KEY_ORDER = ("tps", "y", "value", "rate", "count")
+_TIMESTAMP_KEY_ORDER = ("endTimeSeconds", "beginTimeSeconds", "x", "timestamp", "endTime", "time")
+_TIMESTAMP_KEYS = frozenset(_TIMESTAMP_KEY_ORDER)
+_SERIES_FAST_PATH_MIN_POINTS = 16
+# Epoch values above this are treated as milliseconds.
+_MS_THRESHOLD = 1e12
+DEFAULT_WIDGET_CACHE_SIZE = 256
 
 
 class WidgetParser:
     """Parse dashboard widgets into normalized metrics."""
 
     TREND_ARROWS = {"↗": "up", "▲": "up", "↑": "up", "↘": "down", "▼": "down", "↓": "down"}
+    # Ordered (title keywords, metric key) rules; the first rule whose keywords
+    # are all words of the lowercased title wins.
+    _RULES = (
+        (frozenset({"total"}), "tsys_tps"),
+        (frozenset({"tsys", "tps"}), "tsys_tps"),
+        (frozenset({"hpns", "tps"}), "hpns_tps"),
+        (frozenset({"tsys", "capacity"}), "tsys_capacity"),
+        (frozenset({"hpns", "capacity"}), "hpns_capacity"),
+        (frozenset({"ratio"}), "tps_ratio"),
+    )
+
+    def __init__(self, cache_size: int = DEFAULT_WIDGET_CACHE_SIZE) -> None:
+        # LRU of parsed widgets keyed by (widget id, updatedAt); see _parse_cached.
+        self._cache: OrderedDict[Tuple[Hashable, Hashable], Optional[Dict[str, Any]]] = OrderedDict()
+        self._cache_size = cache_size
 
-    def parse(self, widgets: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    def parse(self, widgets: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Parse widgets and map them to TSYS/HPNS metrics.
 
         Returns a mapping where each value is a plain dict to remain compatible
@@ -36,38 +60,72 @@ class WidgetParser:
         """
 
         normalized: Dict[str, Dict[str, Any]] = {}
+        # Bind per-widget lookups to locals; this loop runs once per widget.
+        setdefault = normalized.setdefault
+        parse_cached = self._parse_cached
+        find_words = _WORD_RE.findall
+        rules = self._RULES
         for widget in widgets:
-            metric = self._parse_widget(widget)
+            metric = parse_cached(widget)
             if not metric:
                 continue
-            title = (metric.get("title") or "").lower()
-            if "total" in title or "tsys" in title and "tps" in title:
-                normalized.setdefault("tsys_tps", metric)
-            elif "hpns" in title and "tps" in title:
-                normalized.setdefault("hpns_tps", metric)
-            elif "tsys" in title and "capacity" in title:
-                normalized.setdefault("tsys_capacity", metric)
-            elif "hpns" in title and "capacity" in title:
-                normalized.setdefault("hpns_capacity", metric)
-            elif "ratio" in title:
-                normalized.setdefault("tps_ratio", metric)
+            tokens = set(find_words((metric.get("title") or "").lower()))
+            for needles, key in rules:
+                if needles <= tokens:
+                    setdefault(key, metric)
+                    break
         return normalized
 
+    def _parse_cached(self, widget: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse *widget*, reusing the previous result while its version is unchanged.
+
+        Only widgets exposing both an ``id`` and a ``data.visualization.updatedAt``
+        stamp are cached; anything else is always parsed, so a missing stamp can
+        never serve stale values.
+        """
+        widget_id = widget.get("id")
+        updated_at = ((widget.get("data") or {}).get("visualization") or {}).get("updatedAt")
+        if widget_id is None or updated_at is None or self._cache_size <= 0:
+            return self._parse_widget(widget)
+        key = (widget_id, updated_at)
+        try:
+            metric = self._cache[key]
+        except TypeError:
+            return self._parse_widget(widget)
+        except KeyError:
+            metric = self._parse_widget(widget)
+            self._cache[key] = metric
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        # Hand out copies so callers cannot mutate the cached entry.
+        return dict(metric) if metric is not None else None
+
     def _parse_widget(self, widget: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        title = widget.get("title") or widget.get("layout", {}).get("title", "")
+        title = widget.get("title") or (widget.get("layout") or {}).get("title", "")
         if not title:
             return None
 
-        visualization_data = widget.get("data", {}).get("visualization") or {}
-        raw_value = self._extract_current_value(widget, visualization_data)
-        comparison_pct = self._extract_comparison_pct(widget, visualization_data)
-        trend = self._extract_trend(widget, visualization_data)
-        peak_value, peak_time = self._extract_peak(widget)
+        # Bind the nested payloads once and hand them to the extractors.
+        data = widget.get("data") or {}
+        raw = data.get("raw") or {}
+        viz = data.get("visualization") or {}
+        cfg = widget.get("rawConfiguration") or {}
 
+        raw_value = self._extract_current_value(widget, raw, cfg, viz)
         if raw_value is None:
             return None
 
-        display_value = widget.get("rawConfiguration", {}).get("title") or str(raw_value)
+        comparison_pct = self._extract_comparison_pct(raw, cfg, viz)
+        trend = self._extract_trend(widget, raw, cfg, viz)
+        if _may_hold_points(raw) or _may_hold_points(viz):
+            peak_value, peak_time = self._extract_peak(raw, viz)
+        else:
+            # Scalar billboard tiles carry no time series, so skip the traversal.
+            peak_value = peak_time = None
+
+        display_value = cfg.get("title") or str(raw_value)
         metric: Dict[str, Any] = {
             "title": title,
             "current_value": raw_value,
@@ -81,126 +139,116 @@ class WidgetParser:
             metric["peak_time"] = peak_time
         return metric
 
-    def _extract_current_value(self, widget: Dict[str, Any], viz: Dict[str, Any]) -> Optional[float]:
+    def _extract_current_value(
+        self,
+        widget: Dict[str, Any],
+        raw: Dict[str, Any],
+        cfg: Dict[str, Any],
+        viz: Dict[str, Any],
+    ) -> Optional[float]:
         candidates = [
             viz.get("currentValue"),
-            widget.get("rawConfiguration", {}).get("nrqlQueries", [{}])[0].get("value"),
-            widget.get("data", {}).get("raw", {}).get("current"),
-            widget.get("data", {}).get("raw", {}).get("value"),
+            (cfg.get("nrqlQueries") or [{}])[0].get("value"),
+            raw.get("current"),
+            raw.get("value"),
         ]
         text = self._first_non_none(candidates) or widget.get("title")
-        return self._parse_numeric(text)
+        return _parse_numeric(text)
 
-    def _extract_comparison_pct(self, widget: Dict[str, Any], viz: Dict[str, Any]) -> Optional[float]:
+    def _extract_comparison_pct(
+        self,
+        raw: Dict[str, Any],
+        cfg: Dict[str, Any],
+        viz: Dict[str, Any],
+    ) -> Optional[float]:
         candidates = [
             viz.get("comparison"),
-            widget.get("data", {}).get("raw", {}).get("comparison"),
-            widget.get("rawConfiguration", {}).get("thresholds", [{}])[0].get("value"),
+            raw.get("comparison"),
+            (cfg.get("thresholds") or [{}])[0].get("value"),
         ]
         text = self._first_non_none(candidates)
-        return self._parse_numeric(text)
+        return _parse_numeric(text)
 
-    def _extract_trend(self, widget: Dict[str, Any], viz: Dict[str, Any]) -> str:
-        trend = viz.get("trend") or widget.get("data", {}).get("raw", {}).get("trend")
+    def _extract_trend(
+        self,
+        widget: Dict[str, Any],
+        raw: Dict[str, Any],
+        cfg: Dict[str, Any],
+        viz: Dict[str, Any],
+    ) -> str:
+        trend = viz.get("trend") or raw.get("trend")
         if trend:
             return trend.lower()
         title = widget.get("title", "")
-        for arrow, name in self.TREND_ARROWS.items():
-            if arrow in title:
-                return name
-        comparison = widget.get("rawConfiguration", {}).get("subtitle", "")
-        for arrow, name in self.TREND_ARROWS.items():
-            if arrow in comparison:
-                return name
+        if _UP_ARROW_RE.search(title):
+            return "up"
+        if _DOWN_ARROW_RE.search(title):
+            return "down"
+        comparison = cfg.get("subtitle", "")
+        if _UP_ARROW_RE.search(comparison):
+            return "up"
+        if _DOWN_ARROW_RE.search(comparison):
+            return "down"
         return "neutral"
 
-    def _extract_peak(self, widget: Dict[str, Any]) -> tuple[Optional[float], Optional[str]]:
+    def _extract_peak(self, raw: Any, viz: Any) -> tuple[Optional[float], Optional[str]]:
         """Derive peak value and timestamp from any embedded time-series data.
 
         Searches common locations in dashboard widget data and attempts to
         interpret heterogeneous point schemas robustly.
         """
-        raw = (widget.get("data", {}) or {}).get("raw")
-        viz = (widget.get("data", {}) or {}).get("visualization")
-        points: List[tuple[float, int]] = []
-        points.extend(self._gather_points(raw))
-        points.extend(self._gather_points(viz))
-
-        if not points:
+        best = self._gather_points(viz, self._gather_points(raw))
+        if best is None:
             return None, None
 
-        # Choose the point with the highest value
-        peak_val, peak_ts = max(points, key=lambda p: p[0])
+        peak_val, peak_ts = best
         # Format timestamp in US/Eastern as per reporting convention
         try:
-            tz_et = pytz.timezone("US/Eastern")
-            dt = datetime.fromtimestamp(peak_ts, tz=pytz.utc).astimezone(tz_et)
-            peak_time_str = dt.strftime("%-I:%M %p ET on %b %d, %Y")
-        except Exception:
-            peak_time_str = str(peak_ts)
+            dt = datetime.fromtimestamp(peak_ts, tz=_TZ_UTC).astimezone(_TZ_ET)
+        except (OverflowError, OSError, ValueError):
+            return float(peak_val), str(peak_ts)
+        # Built by hand because "%-I" is a glibc-only strftime extension.
+        meridiem = "PM" if dt.hour >= 12 else "AM"
+        peak_time_str = f"{dt.hour % 12 or 12}:{dt.minute:02d} {meridiem} ET on {dt:%b %d, %Y}"
         return float(peak_val), peak_time_str
 
-    def _gather_points(self, obj: Any) -> List[tuple[float, int]]:
-        """Recursively traverse an arbitrary object to collect (value, epoch_s) points."""
-        results: List[tuple[float, int]] = []
-        if obj is None:
-            return results
-        if isinstance(obj, list):
-            for item in obj:
-                results.extend(self._gather_points(item))
-            return results
-        if isinstance(obj, dict):
-            # Attempt to treat this dict as a point first
-            value = self._first_numeric(
-                [
-                    obj.get("tps"),
-                    obj.get("y"),
-                    obj.get("value"),
-                    obj.get("rate"),
-                    obj.get("count"),
-                ]
-            )
-            ts = self._first_non_none(
-                [
-                    obj.get("endTimeSeconds"),
-                    obj.get("beginTimeSeconds"),
-                    obj.get("x"),
-                    obj.get("timestamp"),
-                    obj.get("endTime"),
-                    obj.get("time"),
-                ]
-            )
-            ts_epoch = self._to_epoch_seconds(ts)
-            if value is not None and ts_epoch is not None:
-                results.append((float(value), ts_epoch))
-
-            # Recurse into children
-            for v in obj.values():
-                results.extend(self._gather_points(v))
-            return results
-        return results
+    def _gather_points(
+        self,
+        obj: Any,
+        best: Optional[tuple[float, int]] = None,
+    ) -> Optional[tuple[float, int]]:
+        """Traverse an arbitrary object and return its highest (value, epoch_s) point.
 
-    @staticmethod
-    def _parse_numeric(value: Any) -> Optional[float]:
-        if value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            cleaned = value.strip()
-            multiplier = 1.0
-            if cleaned.endswith("%"):
-                cleaned = cleaned[:-1]
-            if cleaned.lower().endswith("k"):
-                multiplier = 1_000
-                cleaned = cleaned[:-1]
-            if cleaned.lower().endswith("m"):
-                multiplier = 1_000_000
-                cleaned = cleaned[:-1]
-            match = re.search(r"-?\d+(?:\.\d+)?", cleaned)
-            if match:
-                return float(match.group()) * multiplier
-        return None
+        Only the running maximum is kept, starting from *best* so several
+        payloads can be folded together; ties keep the earliest point seen.
+        Uses an explicit stack instead of recursion; children are pushed in
+        reverse so points are visited in the same pre-order as a recursive walk.
+        """
+        stack: List[Any] = [obj]
+        pop = stack.pop
+        push = stack.extend
+        first_numeric = self._first_numeric
+        first_non_none = self._first_non_none
+        to_epoch_seconds = self._to_epoch_seconds
+        value_keys = _VALUE_KEY_ORDER
+        timestamp_keys = _TIMESTAMP_KEY_ORDER
+        while stack:
+            cur = pop()
+            if isinstance(cur, list):
+                peak = _series_peak(cur) if len(cur) >= _SERIES_FAST_PATH_MIN_POINTS else None
+                if peak is None:
+                    push(reversed(cur))
+                elif best is None or peak[0] > best[0]:
+                    best = peak
+            elif isinstance(cur, dict):
+                # Attempt to treat this dict as a point first
+                value = first_numeric([cur.get(key) for key in value_keys])
+                ts = first_non_none([cur.get(key) for key in timestamp_keys])
+                ts_epoch = to_epoch_seconds(ts)
+                if value is not None and ts_epoch is not None and (best is None or value > best[0]):
+                    best = (float(value), ts_epoch)
+                push(child for child in reversed(cur.values()) if isinstance(child, (list, dict)))
+        return best
 
     @staticmethod
     def _first_non_none(values: List[Any]) -> Optional[Any]:
@@ -215,7 +263,7 @@ class WidgetParser:
             if isinstance(v, (int, float)):
                 return float(v)
             if isinstance(v, str):
-                parsed = WidgetParser._parse_numeric(v)
+                parsed = _parse_numeric(v)
                 if parsed is not None:
                     return parsed
         return None
@@ -226,30 +274,121 @@ class WidgetParser:
             return None
         # Numeric seconds or milliseconds
         if isinstance(ts, (int, float)):
-            t = float(ts)
-            # Heuristic: treat large numbers as milliseconds
-            if t > 1e12:
-                t /= 1000.0
-            return int(t)
+            return _normalize_epoch(float(ts))
         if isinstance(ts, str):
             s = ts.strip()
-            # Try ISO8601 parsing
+            # Try ISO8601 parsing; fromisoformat accepts a trailing "Z" on 3.11+
             try:
-                s2 = s.replace("Z", "+00:00")
-                dt = datetime.fromisoformat(s2)
+                dt = datetime.fromisoformat(s)
                 if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=pytz.utc)
+                    dt = dt.replace(tzinfo=_TZ_UTC)
                 return int(dt.timestamp())
-            except Exception:
+            except ValueError:
                 # Fallback: numeric string
                 try:
-                    t = float(s)
-                    if t > 1e12:
-                        t /= 1000.0
-                    return int(t)
+                    return _normalize_epoch(float(s))
                 except Exception:
                     return None
         return None
 
 
-__all__ = ["WidgetParser", "WidgetMetric"]
+def _series_peak(items: List[Any]) -> Optional[tuple[float, int]]:
+    """Peak of a homogeneous New Relic time series, or None when the fast path does not apply.
+
+    Applies when every item is a flat dict with the same keys and a numeric
+    value/timestamp pair, e.g. ``[{"beginTimeSeconds": ..., "y": ...}, ...]``.
+    The values and timestamps are pulled into two parallel lists and the peak
+    is found with plain ``max`` and ``list.index`` scans instead of one point
+    check per item.
+    Anything else returns None so the caller falls back to the generic walk.
+    """
+
+    first = items[0]
+    if type(first) is not dict:
+        return None
+    keys = first.keys()
+    # Mirror the generic precedence: the first candidate key present must be the one used.
+    value_key = next((key for key in _VALUE_KEY_ORDER if key in keys), None)
+    ts_key = next((key for key in _TIMESTAMP_KEY_ORDER if key in keys), None)
+    if value_key is None or ts_key is None:
+        return None
+    if not all(type(item) is dict and item.keys() == keys for item in items):
+        return None
+    for item in items:
+        for child in item.values():
+            if isinstance(child, (list, dict)):
+                return None
+
+    values = [item[value_key] for item in items]
+    stamps = [item[ts_key] for item in items]
+    if not all(isinstance(value, (int, float)) for value in values):
+        return None
+    if not all(isinstance(stamp, (int, float)) for stamp in stamps):
+        return None
+    if any(map(math.isnan, values)):
+        return None
+
+    # index() returns the first maximum, matching the generic walk's tie-breaking.
+    peak = max(values)
+    index = values.index(peak)
+    return float(peak), _normalize_epoch(float(stamps[index]))
+
+
+def _normalize_epoch(t: float) -> int:
+    return int(t / 1000.0) if t > _MS_THRESHOLD else int(t)
+
+
+def _may_hold_points(payload: Any) -> bool:
+    """Cheap check for whether *payload* could contain any time-series point."""
+
+    if isinstance(payload, list):
+        return bool(payload)
+    if isinstance(payload, dict):
+        if not _TIMESTAMP_KEYS.isdisjoint(payload):
+            return True
+        return any(isinstance(child, (list, dict)) for child in payload.values())
+    return False
+
+
+def _parse_numeric(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return _parse_numeric_text(value)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_numeric_text(value: str) -> Optional[float]:
+    # Display strings ("1.2k", "3.4%", "0") repeat across widgets and refreshes,
+    # so parsed results are memoized.
+    cleaned = value.strip()
+    # Plain numeric strings are the common case; let float() take them directly.
+    try:
+        number = float(cleaned)
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(number):
+            return number
+    match = _SUFFIXED_NUMBER_RE.fullmatch(cleaned)
+    if match:
+        return float(match.group(1)) * _SUFFIX_MULTIPLIERS[match.group(2) or ""]
+    multiplier = 1.0
+    if cleaned.endswith("%"):
+        cleaned = cleaned[:-1]
+    if cleaned.lower().endswith("k"):
+        multiplier = 1_000
+        cleaned = cleaned[:-1]
+    if cleaned.lower().endswith("m"):
+        multiplier = 1_000_000
+        cleaned = cleaned[:-1]
+    match = _NUMERIC_RE.search(cleaned)
+    if match:
+        return float(match.group()) * multiplier
+    return None
+
+
+__all__ = ["WidgetParser"]